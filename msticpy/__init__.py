@@ -27,8 +27,6 @@ GitHub repo:
     https://github.com/microsoft/msticpy
 
 """
-from pkg_resources import parse_version
-
 import requests
 
 # flake8: noqa: F403
@@ -46,6 +44,9 @@ __author__ = "Ian Hellen, Pete Bryan, Ashwin Patil"
 
 def check_version():
     """Check the current version against latest on PyPI."""
+    # pylint: disable=import-outside-toplevel
+    from pkg_resources import parse_version
+
     installed_version = parse_version(__version__)
 
     # fetch package metadata from PyPI
@@ -20,13 +20,12 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Callable
 
-import pkg_resources
 import yaml
 from yaml.error import YAMLError
 
 from . import exceptions
 from .exceptions import MsticpyUserConfigError
-from .utility import is_valid_uuid
+from .utility import is_valid_uuid, resource_path
 from .._version import VERSION
 
 __version__ = VERSION
@@ -186,9 +185,8 @@ def _override_config(base_config: Dict[str, Any], new_config: Dict[str, Any]):
 def _get_default_config():
     """Return the package default config file."""
     conf_file = None
-    package = "msticpy"
     try:
-        conf_file = pkg_resources.resource_filename(package, _CONFIG_FILE)
+        conf_file = resource_path("msticpy", _CONFIG_FILE)
     except ModuleNotFoundError as mod_err:
         # if all else fails we try to find the package default config somewhere
         # in the package tree - we use the first one we find
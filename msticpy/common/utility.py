@@ -12,10 +12,10 @@ import subprocess  # nosec
 import sys
 import uuid
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-import pkg_resources
 from deprecated.sphinx import deprecated
 from IPython import get_ipython
 from IPython.core.display import HTML, display
@@ -58,6 +58,37 @@ def is_not_empty(test_object: Any) -> bool:
     return False
 
 
+@export
+@lru_cache(maxsize=None)
+def resource_path(package: str, file_name: str) -> str:
+    """
+    Return the path of a resource file in a package.
+
+    Parameters
+    ----------
+    package : str
+        The package name (e.g. "msticpy")
+    file_name : str
+        The resource path relative to the package.
+
+    Returns
+    -------
+    str
+        Path to the resource file.
+
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from importlib.resources import files  # type: ignore
+    except ImportError:
+        # importlib.resources.files needs Python 3.9+
+        # pylint: disable=import-outside-toplevel
+        import pkg_resources
+
+        return pkg_resources.resource_filename(package, file_name)
+    return str(files(package).joinpath(file_name))
+
+
 # Toggle Code Cell Contents
 _TOGGLE_CODE_STR = """
 <form action="javascript:code_toggle()">
@@ -256,6 +287,9 @@ def check_and_install_missing_packages(
         True if successful, else False
 
     """
+    # pylint: disable=import-outside-toplevel
+    import pkg_resources
+
     missing_packages = []
     # Check package requirements against installed set
     for req in required_packages:
@@ -7,7 +7,7 @@
 import warnings
 from datetime import datetime
 from functools import partial
-from itertools import tee
+from itertools import chain, tee
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Union
 
@@ -109,11 +109,11 @@ class QueryProvider:
         self.all_queries = QueryContainer()
 
         # Add any query files
-        data_env_queries: Dict[str, QueryStore] = {}
-        if driver.use_query_paths:
-            data_env_queries.update(
-                self._read_queries_from_paths(query_paths=query_paths)
-            )
+        data_env_queries: Dict[str, QueryStore] = (
+            self._read_queries_from_paths(query_paths=query_paths)
+            if driver.use_query_paths
+            else {}
+        )
         self._query_store = data_env_queries.get(
             self._environment, QueryStore(self._environment)
         )
@@ -358,16 +358,11 @@ class QueryProvider:
             if qry_path:
                 all_query_paths.append(qry_path)
 
-        if settings.get("Custom") is not None:
-            for custom_path in settings.get("Custom"):  # type: ignore
-                qry_path = self._resolve_path(custom_path)
-                if qry_path:
-                    all_query_paths.append(qry_path)
-        if query_paths:
-            for custom_path in query_paths:
-                qry_path = self._resolve_path(custom_path)
-                if qry_path:
-                    all_query_paths.append(qry_path)
+        # Config file custom paths followed by any passed as parameters
+        for custom_path in chain(settings.get("Custom") or [], query_paths or []):
+            qry_path = self._resolve_path(custom_path)
+            if qry_path:
+                all_query_paths.append(qry_path)
 
         if not all_query_paths:
             raise RuntimeError(
@@ -378,6 +373,10 @@ class QueryProvider:
 
     def _add_query_functions(self):
         """Add queries to the module as callable methods."""
+        # bind these once rather than on every pass through the loop
+        execute_query = self._execute_query
+        get_query = self._query_store.get_query
+        all_queries = self.all_queries
         for qual_query_name in self.list_queries():
             query_path = qual_query_name.split(".")
             query_name = query_path[-1]
@@ -395,15 +394,15 @@ class QueryProvider:
 
             # Create the partial function
             query_func = partial(
-                self._execute_query, query_path=query_cont_name, query_name=query_name
+                execute_query, query_path=query_cont_name, query_name=query_name
             )
-            query_func.__doc__ = self._query_store.get_query(
+            query_func.__doc__ = get_query(
                 query_path=query_cont_name, query_name=query_name
             ).create_doc_string()
 
             query_name = valid_pyname(query_name)
             setattr(current_node, query_name, query_func)
-            setattr(self.all_queries, query_name, query_func)
+            setattr(all_queries, query_name, query_func)
 
     def _add_driver_queries(self, queries: Iterable[Dict[str, str]]):
         """Add driver queries to the query store."""
@@ -441,9 +440,10 @@ class QueryProvider:
 
         ranges = self._calc_split_ranges(start, end, split_delta)
 
+        formatters = self._query_provider.formatters
         split_queries = [
             query_source.create_query(
-                formatters=self._query_provider.formatters,
+                formatters=formatters,
                 start=q_start,
                 end=q_end,
                 **query_params,
@@ -4,6 +4,8 @@
 # license information.
 # --------------------------------------------------------------------------
 """Data query definition reader."""
+import os
+from copy import deepcopy
 from typing import Tuple, Dict, Iterable, Any
 from pathlib import Path
 import yaml
@@ -14,6 +16,11 @@ from .._version import VERSION
 __version__ = VERSION
 __author__ = "Ian Hellen"
 
+# Parsed query files - keyed by path with (modified time, contents) values
+_QUERY_FILE_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+# Use the libyaml-based loader, if available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def find_yaml_files(source_path: str, recursive: bool = False) -> Iterable[Path]:
     """
@@ -59,12 +66,7 @@ def read_query_def_file(query_file: str) -> Tuple[Dict, Dict, Dict]:
         metadata - the global metadata from the file
 
     """
-    data_map = None
-    with open(query_file) as f_handle:
-        # use safe_load instead load
-        data_map = yaml.safe_load(f_handle)
-
-    validate_query_defs(query_def_dict=data_map)
+    data_map = _read_query_yaml(query_file)
 
     defaults = data_map.get("defaults", {})
     sources = data_map.get("sources", {})
@@ -73,6 +75,23 @@ def read_query_def_file(query_file: str) -> Tuple[Dict, Dict, Dict]:
     return sources, defaults, metadata
 
 
+def _read_query_yaml(query_file: str) -> Dict[str, Any]:
+    """Return validated contents of `query_file`, re-using cached results."""
+    file_path = str(Path(query_file).resolve())
+    mod_time = os.stat(file_path).st_mtime_ns
+    cached_file = _QUERY_FILE_CACHE.get(file_path)
+    if cached_file is None or cached_file[0] != mod_time:
+        with open(file_path) as f_handle:
+            # use (C)SafeLoader instead of the unsafe default loader
+            data_map = yaml.load(f_handle, Loader=_YAML_LOADER)  # nosec
+        validate_query_defs(query_def_dict=data_map)
+        cached_file = mod_time, data_map
+        _QUERY_FILE_CACHE[file_path] = cached_file
+    # return a copy since QuerySource instances keep references to
+    # (and may update) these dictionaries
+    return deepcopy(cached_file[1])
+
+
 def validate_query_defs(query_def_dict: Dict[str, Any]) -> bool:
     """
     Validate content of query definition.
@@ -234,8 +234,10 @@ class QuerySource:
         parameter defaults (see `default_params` property).
 
         """
+        # merge the params ChainMap once rather than on each iteration
+        params = dict(self.params)
         param_dict = {
-            name: value.get("default", None) for name, value in self.params.items()
+            name: value.get("default", None) for name, value in params.items()
         }
         param_dict.update(kwargs)
         missing_params = {
@@ -248,11 +250,12 @@ class QuerySource:
 
         # Handle formatting for datetimes and cases where a format
         # template has been supplied
-        for p_name, settings in self.params.items():
+        for p_name, settings in params.items():
+            p_type = settings["type"]
             # These types may require custom extraction
-            if settings["type"] == "datetime":
+            if p_type == "datetime":
                 param_dict[p_name] = self._convert_datetime(param_dict[p_name])
-            if settings["type"] == "list":
+            if p_type == "list":
                 param_dict[p_name] = self._parse_param_list(param_dict[p_name])
 
             # The parameter may need custom formatting
@@ -260,16 +263,14 @@ class QuerySource:
             if fmt_template:
                 # custom formatting template in the query definition
                 param_dict[p_name] = fmt_template.format(param_dict[p_name])
-            elif settings["type"] == "datetime" and isinstance(
-                param_dict[p_name], datetime
-            ):
+            elif p_type == "datetime" and isinstance(param_dict[p_name], datetime):
                 if formatters and "datetime" in formatters:
                     param_dict[p_name] = formatters["datetime"](param_dict[p_name])
                 else:
                     param_dict[p_name] = self._format_datetime_default(
                         param_dict[p_name]
                     )
-            elif settings["type"] == "list":
+            elif p_type == "list":
                 if formatters and "list" in formatters:
                     param_dict[p_name] = formatters["list"](param_dict[p_name])
                 else:
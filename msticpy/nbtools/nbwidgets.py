@@ -6,6 +6,7 @@
 """Module for pre-defined widget layouts."""
 import asyncio
 import json
+import math
 import os
 import random
 from abc import ABC
@@ -333,7 +334,14 @@ class QueryTime(RegisteredWidget):
 
         # Call superclass to register
         ids_params = [origin_time, before, after, max_before, max_after, label, units]
-        ids_attribs = ["origin_time", "before", "after", "_query_start", "_query_end"]
+        ids_attribs = [
+            "origin_time",
+            "before",
+            "after",
+            "max_before",
+            "_query_start",
+            "_query_end",
+        ]
         super().__init__(id_vals=ids_params, val_attrs=ids_attribs, **kwargs)
 
         # Create widgets
@@ -392,6 +400,45 @@ class QueryTime(RegisteredWidget):
             )
         )
 
+    def update_timespan(self, start: datetime, end: datetime):
+        """
+        Update the query time range of the existing widgets.
+
+        This avoids the cost of creating a new QueryTime instance
+        (and its widgets) if only the time boundaries need to change.
+        The origin time is set to `end`. The time range slider only
+        supports whole time units, so the range is rounded up and
+        the resulting start time may be earlier than `start`.
+
+        Parameters
+        ----------
+        start : datetime
+            The new query start time
+        end : datetime
+            The new query end time
+
+        Raises
+        ------
+        ValueError
+            If `start` is later than `end`.
+
+        """
+        if start > end:
+            raise ValueError("start time must be earlier than end time.")
+        self.before = math.ceil((end - start).total_seconds() / self._time_unit.value)
+        self.after = 0
+        self.max_before = max(self.max_before, self.before)
+
+        # update the widgets - this triggers the change handlers, so
+        # set the origin and recalculate the times once they have run
+        self._w_tm_range.min = -self.max_before
+        self._w_origin_dt.value = end.date()
+        self._w_origin_tm.value = str(end.time())
+        self._w_tm_range.value = [-self.before, self.after]
+
+        self.origin_time = end
+        self._time_range_change(change=None)
+
     def _update_origin(self, change):
         del change
         try:
@@ -936,7 +983,7 @@ class SelectItem:
         elif item_dict:
             self._item_list = list(item_dict.keys())
             self._item_dict = item_dict
-            self.value = list(self._item_dict.values())[0]
+            self.value = next(iter(self._item_dict.values()))
         else:
             raise ValueError("One of item_list or item_dict must be supplied.")
 
@@ -200,7 +200,7 @@ def _extract_event(message_dict: Mapping[str, Any]) -> Tuple[str, Mapping[str, A
             # there are multiple messages with the same key, the
             # last one will overwrite the previous value
             event_dict.update(message_dict[mssg_type])
-    return list(message_dict.keys())[0], event_dict
+    return next(iter(message_dict)), event_dict
 
 
 def _extract_mssg_value(
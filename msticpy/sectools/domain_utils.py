@@ -24,7 +24,6 @@ from urllib.error import HTTPError, URLError
 import cryptography as crypto
 import dns.resolver
 import pandas as pd
-import pkg_resources
 import requests
 import tldextract
 from IPython import display
@@ -33,11 +32,14 @@ from ipywidgets import IntProgress
 from .._version import VERSION
 from ..common import pkg_config as config
 from ..common.exceptions import MsticpyUserConfigError
-from ..common.utility import export
+from ..common.utility import export, resource_path
 
 __version__ = VERSION
 __author__ = "Pete Bryan"
 
+_TLD_SEED_FILE = "tld_seed.txt"
+_TLD_SEED_PATH = resource_path(__package__, _TLD_SEED_FILE)
+
 
 @export
 def screenshot(url: str, api_key: str = None) -> requests.models.Response:
@@ -268,8 +270,7 @@ class DomainValidator:
     @classmethod
     def _read_tld_seed_file(cls) -> Set[str]:
         """Read TLD seed list from seed file."""
-        seed_file = "tld_seed.txt"
-        conf_file = pkg_resources.resource_filename(__name__, seed_file)
+        conf_file = _TLD_SEED_PATH
 
         if not Path(conf_file).is_file():
             # if all else fails we try to find the package default config somewhere
@@ -277,7 +278,7 @@ class DomainValidator:
             pkg_paths = sys.modules["msticpy"]
             if pkg_paths:
                 conf_file = str(
-                    next(Path(pkg_paths.__path__[0]).glob(seed_file))  # type: ignore
+                    next(Path(pkg_paths.__path__[0]).glob(_TLD_SEED_FILE))  # type: ignore
                 )
 
         if conf_file:
@@ -291,8 +292,7 @@ class DomainValidator:
     def _write_tld_seed_file(cls):
         """Write existing TLD list to a text file."""
         if cls._tld_index:
-            seed_file = "tld_seed.txt"
-            with open(seed_file, "w") as file_handle:
+            with open(_TLD_SEED_FILE, "w") as file_handle:
                 file_handle.write("\n".join(sorted(cls.tld_index)))
 
     @classmethod
@@ -5,7 +5,7 @@
 # --------------------------------------------------------------------------
 """msticpy IPython magics."""
 import re
-from typing import Tuple, List
+from typing import List, Optional, Tuple
 
 # pylint: disable=unused-import
 # flake8: noqa: F403
@@ -104,7 +104,14 @@ class IoCExtractMagic(Magics):
         """
         # You must call the parent constructor
         super().__init__(shell)
-        self._ioc_extract = IoCExtract()
+        self._ioc_extract: Optional[IoCExtract] = None
+
+    @property
+    def ioc_extract(self) -> IoCExtract:
+        """Return IoCExtract instance, creating it on first use."""
+        if self._ioc_extract is None:
+            self._ioc_extract = IoCExtract()
+        return self._ioc_extract
 
     @line_cell_magic
     @magic_arguments.magic_arguments()
@@ -139,9 +146,9 @@ class IoCExtractMagic(Magics):
             ioc_types = [ioc_type.strip() for ioc_type in args.ioc_types.split(",")]
 
         if cell is None:
-            results = self._ioc_extract.extract(src=line, ioc_types=ioc_types)
+            results = self.ioc_extract.extract(src=line, ioc_types=ioc_types)
         else:
-            results = self._ioc_extract.extract(src=cell, ioc_types=ioc_types)
+            results = self.ioc_extract.extract(src=cell, ioc_types=ioc_types)
         iocs = [(ioc_type, list(ioc_res)) for ioc_type, ioc_res in results.items()]
 
         if args.out is not None:
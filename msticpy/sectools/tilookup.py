@@ -15,8 +15,8 @@ requests per minute for the account type that you have.
 import sys  # noqa
 import warnings
 from collections import ChainMap
-from inspect import isclass
-from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Union
 
 import attr
 import pandas as pd
@@ -45,6 +45,24 @@ https://msticpy.readthedocs.io/en/latest/TIProviders.html
 """
 
 
+@lru_cache(maxsize=None)
+def _all_subclasses(cls: type) -> FrozenSet[type]:
+    """
+    Return all direct and indirect subclasses of `cls`.
+
+    Notes
+    -----
+    Results are cached - any subclasses defined after the first call
+    for `cls` will not be returned.
+
+    """
+    sub_classes = set()
+    for sub_class in cls.__subclasses__():
+        sub_classes.add(sub_class)
+        sub_classes.update(_all_subclasses(sub_class))
+    return frozenset(sub_classes)
+
+
 @export
 class TILookup:
     """Threat Intel observable lookup from providers."""
@@ -152,18 +170,19 @@ class TILookup:
 
     @classmethod
     def _get_available_providers(cls):
+        # Walk the TIProvider class tree rather than running
+        # isclass/issubclass against every attribute of tiproviders.
         providers = []
-        for provider_name in dir(tiproviders):
-            provider_class = getattr(tiproviders, provider_name, None)
-            if not (provider_class and isclass(provider_class)):
-                continue
-            # if it is a class - we only want to show concrete classes
-            # that are sub-classes of TIProvider
-            if issubclass(provider_class, tiproviders.TIProvider) and not bool(
+        for provider_class in _all_subclasses(tiproviders.TIProvider):
+            # we only want to show concrete classes that are exposed
+            # by the tiproviders package
+            if getattr(
+                tiproviders, provider_class.__name__, None
+            ) is provider_class and not bool(
                 getattr(provider_class, "__abstractmethods__", False)
             ):
                 providers.append(provider_class.__name__)
-        return providers
+        return sorted(providers)
 
     @classmethod
     def list_available_providers(
@@ -333,7 +352,8 @@ class TILookup:
         ioc_query_type: str, optional
             The ioc query type (e.g. rep, info, malware)
         providers: List[str]
-            Explicit list of providers to use
+            Explicit list of providers to use. Results are returned
+            in the order of the names in this list.
         prov_scope : str, optional
             Use "primary", "secondary" or "all" providers, by default "primary"
         kwargs :
@@ -394,7 +414,8 @@ class TILookup:
         ioc_query_type: str, optional
             The ioc query type (e.g. rep, info, malware)
         providers: List[str]
-            Explicit list of providers to use
+            Explicit list of providers to use. Results are returned
+            in the order of the names in this list.
         prov_scope : str, optional
             Use "primary", "secondary" or "all" providers, by default "primary"
         kwargs :
@@ -411,6 +432,12 @@ class TILookup:
         if not selected_providers:
             raise RuntimeError(_NO_PROVIDERS_MSSG)
 
+        hide_status = []
+        if not kwargs.get("show_not_supported", False):
+            hide_status.append(TILookupStatus.not_supported.value)
+        if not kwargs.get("show_bad_ioc", False):
+            hide_status.append(TILookupStatus.bad_format.value)
+
         for prov_name, provider in selected_providers.items():
             provider_result = provider.lookup_iocs(
                 data=data,
@@ -421,13 +448,10 @@ class TILookup:
             )
             if provider_result is None or provider_result.empty:
                 continue
-            if not kwargs.get("show_not_supported", False):
-                provider_result = provider_result[
-                    provider_result["Status"] != TILookupStatus.not_supported.value
-                ]
-            if not kwargs.get("show_bad_ioc", False):
+            if hide_status:
+                # filter out all of the unwanted status values in one pass
                 provider_result = provider_result[
-                    provider_result["Status"] != TILookupStatus.bad_format.value
+                    ~provider_result["Status"].isin(hide_status)
                 ]
             provider_result["Provider"] = prov_name
             result_list.append(provider_result)
@@ -467,15 +491,17 @@ class TILookup:
         )
 
     def _select_providers(
-        self, providers: List[str] = None, prov_scope: str = "primary"
+        self, providers: Union[str, List[str]] = None, prov_scope: str = "primary"
     ) -> Dict[str, TIProvider]:
         """
         Return required subset of providers.
 
         Parameters
         ----------
-        providers : List[str], optional
-            Explicit list of provider names, by default None
+        providers : Union[str, List[str]], optional
+            Explicit provider name or list of provider names, by default None.
+            Selected providers are returned in the order of the names
+            in this list.
         prov_scope : str, optional
             Provider scope, by default "primary"
             Other values are "all" and "secondary"
@@ -487,10 +513,13 @@ class TILookup:
 
         """
         if providers:
+            if isinstance(providers, str):
+                providers = [providers]
+            # look up the requested names rather than scanning all providers
             selected_providers = {
-                prov_name: prov
-                for prov_name, prov in self._all_providers.items()
-                if prov_name in providers
+                prov_name: self._all_providers[prov_name]
+                for prov_name in providers
+                if prov_name in self._all_providers
             }
         else:
             if prov_scope == "all":
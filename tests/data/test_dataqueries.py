@@ -5,14 +5,19 @@
 # --------------------------------------------------------------------------
 """datq query test class."""
 from datetime import datetime
+import os
+import shutil
 import unittest
 from functools import partial
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Tuple, Union, Optional, Dict, Iterable
 
 import pandas as pd
 
+from msticpy.data import data_query_reader
 from msticpy.data.data_providers import DriverBase, QueryContainer, QueryProvider
+from msticpy.data.data_query_reader import read_query_def_file
 from msticpy.data.query_source import QuerySource
 
 from ..unit_test_lib import get_test_data_path
@@ -380,3 +385,30 @@ class TestDataQuery(unittest.TestCase):
             self.assertIn(e_time.isoformat(sep="T") + "Z", queries[idx])
         self.assertIn(start.isoformat(sep="T") + "Z", queries[0])
         self.assertIn(end.isoformat(sep="T") + "Z", queries[-1])
+
+    def test_query_file_cache(self):
+        """Test re-reading of cached query definition files."""
+        file_path = Path(_TEST_DATA, "data_q_success.yaml")
+        sources, _, metadata = read_query_def_file(str(file_path))
+        self.assertIn(str(file_path.resolve()), data_query_reader._QUERY_FILE_CACHE)
+
+        # changes to the returned dicts should not affect the cached copy
+        sources.clear()
+        metadata["data_families"].append("Test")
+        sources, _, metadata = read_query_def_file(str(file_path))
+        self.assertEqual(len(sources), 3)
+        self.assertNotIn("Test", metadata["data_families"])
+
+        with TemporaryDirectory() as tmp_dir:
+            tmp_file = Path(tmp_dir, "data_q_test.yaml")
+            shutil.copy(file_path, tmp_file)
+            sources, _, _ = read_query_def_file(str(tmp_file))
+            self.assertEqual(len(sources), 3)
+
+            # the file should be re-read if it has been modified
+            with open(tmp_file, "w") as f_handle:
+                f_handle.write(file_path.read_text().replace("metadata", "meta"))
+            mod_time = tmp_file.stat().st_mtime_ns + 1_000_000_000
+            os.utime(tmp_file, ns=(mod_time, mod_time))
+            with self.assertRaises(ValueError):
+                read_query_def_file(str(tmp_file))
@@ -5,11 +5,14 @@
 # --------------------------------------------------------------------------
 import unittest
 import os
+from datetime import datetime, timedelta
 from pathlib import Path
 import nbformat
 from nbconvert.preprocessors import ExecutePreprocessor, CellExecutionError
 import pytest
 
+from msticpy.nbtools.nbwidgets import QueryTime
+
 _NB_FOLDER = "docs/notebooks"
 _NB_NAME = "NotebookWidgets.ipynb"
 
@@ -37,3 +40,82 @@ class Testnbwidgets(unittest.TestCase):
             with open(nb_err, mode="w", encoding="utf-8") as f:
                 nbformat.write(nb, f)
             raise
+
+
+# pylint: disable=protected-access
+class TestQueryTime(unittest.TestCase):
+    """QueryTime unit test class."""
+
+    def _check_timespan(self, q_times, end, before):
+        # the range is rounded up to whole units of the slider
+        start = end - timedelta(hours=before)
+        self.assertEqual(q_times.start, start)
+        self.assertEqual(q_times.end, end)
+        self.assertEqual(q_times.origin_time, end)
+        self.assertEqual(tuple(q_times._w_tm_range.value), (-before, 0))
+        self.assertLessEqual(q_times._w_tm_range.min, -before)
+        self.assertEqual(q_times._w_start_time_txt.value, start.isoformat(sep=" "))
+        self.assertEqual(q_times._w_end_time_txt.value, end.isoformat(sep=" "))
+
+    def test_update_timespan(self):
+        """Test updating the time range of an existing QueryTime."""
+        q_times = QueryTime(
+            units="hour",
+            before=2,
+            max_before=4,
+            origin_time=datetime(2020, 1, 1, 12, 0, 0, 500),
+            register=False,
+        )
+
+        # range larger than the original max_before
+        end = datetime(2020, 2, 1, 10, 30, 15, 123)
+        start = end - timedelta(hours=10, minutes=30)
+        q_times.update_timespan(start=start, end=end)
+        self._check_timespan(q_times, end, before=11)
+        self.assertEqual(q_times._w_tm_range.min, -11)
+        self.assertEqual(q_times.max_before, 11)
+
+        # end time with no microseconds
+        end = datetime(2020, 3, 1, 8, 0, 0)
+        start = end - timedelta(hours=3)
+        q_times.update_timespan(start=start, end=end)
+        self._check_timespan(q_times, end, before=3)
+        self.assertEqual(q_times._w_origin_dt.value, end.date())
+        self.assertEqual(q_times._w_origin_tm.value, str(end.time()))
+
+        with self.assertRaises(ValueError):
+            q_times.update_timespan(start=end, end=start)
+
+    def test_update_timespan_change_origin(self):
+        """Test changing the origin time after update_timespan."""
+        q_times = QueryTime(
+            units="hour",
+            before=2,
+            max_before=4,
+            origin_time=datetime(2020, 1, 1, 12, 0, 0, 500),
+            register=False,
+        )
+        end = datetime(2020, 2, 1, 10, 30, 15, 123)
+        q_times.update_timespan(start=end - timedelta(hours=10, minutes=30), end=end)
+        self._check_timespan(q_times, end, before=11)
+
+        # changing the origin should keep the same range relative to the origin
+        q_times._w_origin_tm.value = "09:15:00.000500"
+        new_origin = datetime(2020, 2, 1, 9, 15, 0, 500)
+        self._check_timespan(q_times, new_origin, before=11)
+
+    def test_update_timespan_registered(self):
+        """Test restoring an updated QueryTime from the widget registry."""
+        params = dict(
+            units="hour", before=1, max_before=2, origin_time=datetime(2020, 1, 1)
+        )
+        q_times = QueryTime(**params)
+        end = datetime(2020, 1, 2)
+        start = end - timedelta(hours=20)
+        q_times.update_timespan(start=start, end=end)
+
+        q_times2 = QueryTime(**params)
+        self.assertEqual(q_times2.before, 20)
+        self.assertEqual(q_times2.max_before, 20)
+        self.assertEqual(tuple(q_times2._w_tm_range.value), (-20, 0))
+        self.assertEqual(q_times2._w_tm_range.min, -20)
@@ -266,6 +266,22 @@ class TestTIProviders(unittest.TestCase):
             with self.assertWarns(UserWarning):
                 self.ti_lookup.reload_providers()
 
+    def test_select_providers(self):
+        """Test selecting providers by name."""
+        # pylint: disable=protected-access
+        prov_names = list(self.ti_lookup.loaded_providers.keys())[:2]
+        self.assertEqual(len(prov_names), 2)
+
+        # single provider name passed as a string
+        for prov_name in prov_names:
+            selected = self.ti_lookup._select_providers(providers=prov_name)
+            self.assertEqual(list(selected), [prov_name])
+
+        # list of names - returned in the requested order
+        req_names = [*reversed(prov_names), "NotAProvider"]
+        selected = self.ti_lookup._select_providers(providers=req_names)
+        self.assertEqual(list(selected), list(reversed(prov_names)))
+
     def test_xforce(self):
         self.exercise_provider("XForce")
 